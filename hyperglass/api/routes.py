@@ -8,7 +8,6 @@ from datetime import UTC, datetime
 # Third Party
 from litestar import Request, Response, get, post
 from litestar.di import Provide
-from litestar.background_tasks import BackgroundTask
 
 # Project
 from hyperglass.log import log
@@ -24,7 +23,7 @@ from hyperglass.models.config.devices import Devices, APIDevice
 
 # Local
 from .state import get_state, get_params, get_devices
-from .tasks import send_webhook
+from .tasks import send_webhook, create_background_task
 from .fake_output import fake_output
 
 __all__ = (
@@ -67,39 +66,44 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
     timestamp = datetime.now(UTC)
 
     # Initialize cache
-    cache = _state.redis
+    cache = _state.async_redis
+
+    # Each access of `_state.params` reads & unpickles the params from Redis, so only do it once.
+    params = _state.params
 
     # Use hashed `data` string as key for for k/v cache store so
     # each command output value is unique.
-    cache_key = f"hyperglass.query.{data.digest()}"
+    cache_key = f"q:{data.digest()}"
 
     _log = log.bind(query=data.summary())
 
     _log.info("Starting query execution")
 
-    cache_response = cache.get_map(cache_key, "output")
-    json_output = False
+    # Get the cached output & timestamp, and reset the expiration time if a cached response
+    # exists (expiring a nonexistent key is a no-op), all in a single round trip.
+    cache_response, cached_timestamp = await cache.get_map_items(
+        cache_key, "output", "timestamp", expire_in=params.cache.timeout
+    )
     cached = False
     runtime = 65535
 
     if cache_response:
         _log.bind(cache_key=cache_key).debug("Cache hit")
 
-        # If a cached response exists, reset the expiration time.
-        cache.expire(cache_key, expire_in=_state.params.cache.timeout)
-
+        # Use the cached entry as-is; it doesn't need to be read again.
         cached = True
         runtime = 0
-        timestamp = cache.get_map(cache_key, "timestamp")
+        timestamp = cached_timestamp
+        raw_output = cache_response
 
-    elif not cache_response:
+    else:
         _log.bind(cache_key=cache_key).debug("Cache miss")
 
         timestamp = data.timestamp
 
         starttime = time.time()
 
-        if _state.params.fake_output:
+        if params.fake_output:
             # Return fake, static data for development purposes, if enabled.
             output = await fake_output(
                 query_type=data.query_type,
@@ -114,7 +118,7 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
         _log.debug("Runtime: {!s} seconds", elapsedtime)
 
         if output is None:
-            raise HyperglassError(message=_state.params.messages.general, alert="danger")
+            raise HyperglassError(message=params.messages.general, alert="danger")
 
         json_output = is_type(output, OutputDataModel)
 
@@ -123,26 +127,22 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
         else:
             raw_output = str(output)
 
-        cache.set_map_item(cache_key, "output", raw_output)
-        cache.set_map_item(cache_key, "timestamp", timestamp)
-        cache.expire(cache_key, expire_in=_state.params.cache.timeout)
+        async with cache.batch() as batch:
+            batch.set_map(cache_key, {"output": raw_output, "timestamp": timestamp})
+            batch.expire(cache_key, expire_in=params.cache.timeout)
 
-        _log.bind(cache_timeout=_state.params.cache.timeout).debug("Response cached")
+        _log.bind(cache_timeout=params.cache.timeout).debug("Response cached")
 
         runtime = int(round(elapsedtime, 0))
 
-    # If it does, return the cached entry
-    cache_response = cache.get_map(cache_key, "output")
-
-    json_output = is_type(cache_response, t.Dict)
     response_format = "text/plain"
 
-    if json_output:
+    if isinstance(raw_output, dict):
         response_format = "application/json"
     _log.info("Execution completed")
 
     response = {
-        "output": cache_response,
+        "output": raw_output,
         "id": cache_key,
         "cached": cached,
         "runtime": runtime,
@@ -153,13 +153,10 @@ async def query(_state: HyperglassState, request: Request, data: Query) -> Query
         "keywords": [],
     }
 
-    return Response(
-        response,
-        background=BackgroundTask(
-            send_webhook,
-            params=_state.params,
-            data=data,
-            request=request,
-            timestamp=timestamp,
-        ),
-    )
+    # Send the webhook from a detached task so it doesn't hold up the request.
+    if params.logging.http is not None and params.logging.http.enable:
+        create_background_task(
+            send_webhook(data=data, request=request, timestamp=timestamp, http=params.logging.http)
+        )
+
+    return Response(response)
@@ -2,7 +2,10 @@
 
 # Standard Library
 import typing as t
+import asyncio
 from datetime import datetime
+from collections import Counter
+from contextlib import asynccontextmanager
 
 # Third Party
 from httpx import Headers
@@ -15,9 +18,51 @@ from hyperglass.models.api import Query
 
 if t.TYPE_CHECKING:
     # Project
-    from hyperglass.models.config.params import Params
+    from hyperglass.external import BaseExternal
+    from hyperglass.models.config.logging import Http
 
-__all__ = ("send_webhook",)
+__all__ = ("create_background_task", "send_webhook")
+
+# Strong references to running background tasks, since the event loop only keeps weak references.
+BACKGROUND_TASKS: t.Set[asyncio.Task] = set()
+
+_WEBHOOK: t.Optional[t.Tuple["Http", "BaseExternal"]] = None
+
+# Number of in-flight sends per webhook handler.
+_WEBHOOK_SENDS: t.Counter["BaseExternal"] = Counter()
+
+
+def create_background_task(coro: t.Coroutine[t.Any, t.Any, t.Any]) -> asyncio.Task:
+    """Run a coroutine independently of the request/response cycle."""
+    task = asyncio.create_task(coro)
+    BACKGROUND_TASKS.add(task)
+    task.add_done_callback(BACKGROUND_TASKS.discard)
+    return task
+
+
+@asynccontextmanager
+async def use_webhook(config: "Http") -> t.AsyncGenerator["BaseExternal", None]:
+    """Get a webhook handler, reusing the existing handler & its connection pool if unchanged.
+
+    If the configuration has changed, the previous handler's connection pool is closed once its
+    in-flight sends have finished.
+    """
+    global _WEBHOOK
+    if _WEBHOOK is None or _WEBHOOK[0] != config:
+        previous, _WEBHOOK = _WEBHOOK, (config, Webhook(config))
+        if previous is not None and _WEBHOOK_SENDS[previous[1]] == 0:
+            await previous[1].aclose()
+
+    hook = _WEBHOOK[1]
+    _WEBHOOK_SENDS[hook] += 1
+    try:
+        yield hook
+    finally:
+        _WEBHOOK_SENDS[hook] -= 1
+        if _WEBHOOK_SENDS[hook] == 0:
+            del _WEBHOOK_SENDS[hook]
+            if _WEBHOOK is None or hook is not _WEBHOOK[1]:
+                await hook.aclose()
 
 
 async def process_headers(headers: Headers) -> t.Dict[str, t.Any]:
@@ -35,36 +80,37 @@ async def process_headers(headers: Headers) -> t.Dict[str, t.Any]:
 
 
 async def send_webhook(
-    params: "Params",
     data: Query,
     request: Request,
     timestamp: datetime,
+    http: "Http",
 ) -> t.NoReturn:
-    """If webhooks are enabled, get request info and send a webhook."""
+    """Get request info and send a webhook.
+
+    `http` is the HTTP logging configuration (`params.logging.http`); callers only schedule this
+    task if it is enabled.
+    """
     try:
-        if params.logging.http is not None:
-            headers = await process_headers(headers=request.headers)
-
-            if headers.get("x-real-ip") is not None:
-                host = headers["x-real-ip"]
-            elif headers.get("x-forwarded-for") is not None:
-                host = headers["x-forwarded-for"]
-            else:
-                host = request.client.host
-
-            network_info = await bgptools.network_info(host)
-
-            async with Webhook(params.logging.http) as hook:
-                await hook.send(
-                    query={
-                        **data.dict(),
-                        "headers": headers,
-                        "source": host,
-                        "network": network_info.get(host, {}),
-                        "timestamp": timestamp,
-                    }
-                )
+        headers = await process_headers(headers=request.headers)
+
+        if headers.get("x-real-ip") is not None:
+            host = headers["x-real-ip"]
+        elif headers.get("x-forwarded-for") is not None:
+            host = headers["x-forwarded-for"]
+        else:
+            host = request.client.host
+
+        network_info = await bgptools.network_info(host)
+
+        async with use_webhook(http) as hook:
+            await hook.send(
+                query={
+                    **data.dict(),
+                    "headers": headers,
+                    "source": host,
+                    "network": network_info.get(host, {}),
+                    "timestamp": timestamp,
+                }
+            )
     except Exception as err:
-        log.bind(destination=params.logging.http.provider, error=str(err)).error(
-            "Failed to send webhook"
-        )
+        log.bind(destination=http.provider, error=str(err)).error("Failed to send webhook")
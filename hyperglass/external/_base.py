@@ -10,6 +10,7 @@ from socket import gaierror
 
 # Third Party
 import httpx
+import orjson
 
 # Project
 from hyperglass.log import log
@@ -31,7 +32,8 @@ D = t.TypeVar("D", bound=t.Dict)
 
 
 def _prepare_dict(_dict: D) -> D:
-    return _json.loads(_json.dumps(_dict, default=str))
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    return orjson.loads(orjson.dumps(_dict, default=str, option=option))
 
 
 class BaseExternal:
@@ -57,20 +59,45 @@ class BaseExternal:
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         self.parse = parse
+        self._sync_client: t.Optional[httpx.Client] = None
+        self._async_client: t.Optional[httpx.AsyncClient] = None
 
-        context = httpx.create_ssl_context(verify=verify_ssl)
+    def _client_kwargs(self: "BaseExternal") -> t.Dict[str, t.Any]:
+        """Get keyword arguments for creating an HTTP client."""
+        context = httpx.create_ssl_context(verify=self.verify_ssl)
 
         if Settings.ca_cert is not None:
             context.load_verify_locations(cafile=str(Settings.ca_cert))
 
-        client_kwargs = {
+        return {
             "base_url": self.base_url,
             "timeout": self.timeout,
             "verify": context,
         }
 
-        self._session = httpx.Client(**client_kwargs)
-        self._asession = httpx.AsyncClient(**client_kwargs)
+    @property
+    def _session(self: "BaseExternal") -> httpx.Client:
+        """Get the sync HTTP client, creating it on first use."""
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(**self._client_kwargs())
+        return self._sync_client
+
+    @property
+    def _asession(self: "BaseExternal") -> httpx.AsyncClient:
+        """Get the async HTTP client, creating it on first use.
+
+        The client (and its connection pool) is kept for the life of this instance, so
+        long-lived instances reuse connections across requests.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_kwargs())
+        return self._async_client
+
+    async def aclose(self: "BaseExternal") -> None:
+        """Close the async HTTP client & its connection pool, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     @classmethod
     def __init_subclass__(
@@ -101,7 +128,7 @@ class BaseExternal:
         if exc_type is not None:
             log.error(str(exc_value))
 
-        await self._asession.aclose()
+        await self.aclose()
         if exc_value is not None:
             raise exc_value
         return True
@@ -124,7 +151,8 @@ class BaseExternal:
         """Close connection on exit."""
         if exc_type is not None:
             log.error(str(exc_value))
-        self._session.close()
+        if self._sync_client is not None:
+            self._sync_client.close()
         if exc_value is not None:
             raise exc_value
         return True
@@ -1,6 +1,7 @@
 """Test external http client."""
 # Standard Library
 import asyncio
+from datetime import datetime
 
 # Third Party
 import pytest
@@ -10,11 +11,20 @@ from hyperglass.exceptions.private import ExternalError
 from hyperglass.models.config.logging import Http
 
 # Local
-from .._base import BaseExternal
+from .._base import BaseExternal, _prepare_dict
 
 config = Http(provider="generic", host="https://httpbin.org")
 
 
+def test_prepare_dict():
+    data = {"timestamp": datetime(2024, 1, 1, 1, 2, 3), 1: "one", "nested": {"list": [1, "two"]}}
+    assert _prepare_dict(data) == {
+        "timestamp": "2024-01-01 01:02:03",
+        "1": "one",
+        "nested": {"list": [1, "two"]},
+    }
+
+
 def test_base_external_sync():
     with BaseExternal(base_url="https://httpbin.org", config=config) as client:
         res1 = client._get("/get")
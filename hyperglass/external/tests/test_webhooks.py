@@ -0,0 +1,145 @@
+"""Test webhook delivery from API background tasks."""
+
+# Standard Library
+import typing as t
+import asyncio
+from types import ModuleType, SimpleNamespace
+from datetime import datetime
+
+# Third Party
+import httpx
+import pytest
+
+# Project
+from hyperglass.state import use_state
+from hyperglass.external import BaseExternal, bgptools
+from hyperglass.models.api import Query
+from hyperglass.models.config.params import Params
+from hyperglass.models.config.logging import Http
+
+if t.TYPE_CHECKING:
+    # Project
+    from hyperglass.state import HyperglassState
+
+CONFIG_1 = Http(provider="generic", host="https://192.0.2.1/hook")
+CONFIG_2 = Http(provider="generic", host="https://192.0.2.3/hook")
+
+QUERY = Query.model_construct(
+    query_location="test1", query_target="192.0.2.0/24", query_type="bgp_route"
+)
+REQUEST = SimpleNamespace(headers=httpx.Headers({"x-real-ip": "192.0.2.2"}), client=None)
+TIMESTAMP = datetime(2024, 1, 1, 1, 2, 3)
+
+
+class MockWebhookTransport(httpx.MockTransport):
+    """Record webhook requests, optionally holding them until released."""
+
+    def __init__(self) -> None:
+        """Initialize the mock transport with an async request handler."""
+        self.requests: t.List[httpx.Request] = []
+        self.hold: t.Optional[asyncio.Event] = None
+        super().__init__(self.respond)
+
+    async def respond(self, request: httpx.Request) -> httpx.Response:
+        """Respond to a webhook request."""
+        if self.hold is not None:
+            await self.hold.wait()
+        self.requests.append(request)
+        return httpx.Response(200, json={})
+
+
+@pytest.fixture
+def state() -> t.Generator["HyperglassState", None, None]:
+    """Test fixture to initialize Redis store."""
+    _state = use_state()
+    _state.redis.set("params", Params())
+    yield _state
+    _state.clear()
+
+
+@pytest.fixture
+def transport(monkeypatch: pytest.MonkeyPatch) -> MockWebhookTransport:
+    """Send external HTTP requests to a mock transport."""
+
+    async def network_info(*_: str) -> t.Dict[str, t.Any]:
+        return {}
+
+    _transport = MockWebhookTransport()
+    client_kwargs = BaseExternal._client_kwargs
+    monkeypatch.setattr(
+        BaseExternal,
+        "_client_kwargs",
+        lambda self: {**client_kwargs(self), "transport": _transport},
+    )
+    monkeypatch.setattr(bgptools, "network_info", network_info)
+    return _transport
+
+
+@pytest.fixture
+def tasks(state: "HyperglassState") -> t.Generator[ModuleType, None, None]:
+    """Import API tasks, and reset the cached webhook handler afterwards."""
+    # Imported here, since importing the API package creates the app from state.
+    # Project
+    from hyperglass.api import tasks as _tasks
+
+    yield _tasks
+    _tasks._WEBHOOK = None
+    _tasks._WEBHOOK_SENDS.clear()
+
+
+def _send(tasks: ModuleType, config: Http) -> asyncio.Task:
+    return tasks.create_background_task(
+        tasks.send_webhook(data=QUERY, request=REQUEST, timestamp=TIMESTAMP, http=config)
+    )
+
+
+def _client(tasks: ModuleType) -> t.Optional[httpx.AsyncClient]:
+    if tasks._WEBHOOK is None:
+        return None
+    return tasks._WEBHOOK[1]._async_client
+
+
+async def _run_test_send_webhook(tasks: ModuleType, transport: MockWebhookTransport):
+    clients = []
+    for _ in range(2):
+        task = _send(tasks, CONFIG_1)
+        assert task in tasks.BACKGROUND_TASKS
+        await task
+        # Done callbacks run on the next iteration of the event loop.
+        await asyncio.sleep(0)
+        assert task not in tasks.BACKGROUND_TASKS
+        clients.append(_client(tasks))
+
+    assert len(transport.requests) == 2
+    assert clients[0] is not None
+    assert clients[0] is clients[1], "webhook client was not reused"
+
+    await _send(tasks, CONFIG_2)
+    assert len(transport.requests) == 3
+    assert clients[0].is_closed, "previous webhook client was not closed"
+    assert _client(tasks) is not clients[0]
+
+
+def test_send_webhook(tasks, transport):
+    asyncio.run(_run_test_send_webhook(tasks, transport))
+
+
+async def _run_test_send_webhook_config_change(tasks: ModuleType, transport: MockWebhookTransport):
+    hold = transport.hold = asyncio.Event()
+    pending = _send(tasks, CONFIG_1)
+    while _client(tasks) is None:
+        await asyncio.sleep(0)
+    client = _client(tasks)
+
+    transport.hold = None
+    await _send(tasks, CONFIG_2)
+    assert not client.is_closed, "webhook client was closed during a send"
+
+    hold.set()
+    await pending
+    assert len(transport.requests) == 2, "in-flight webhook was not sent"
+    assert client.is_closed, "previous webhook client was not closed"
+
+
+def test_send_webhook_config_change(tasks, transport):
+    asyncio.run(_run_test_send_webhook_config_change(tasks, transport))
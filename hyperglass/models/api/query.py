@@ -1,12 +1,14 @@
 """Input query validation model."""
 
 # Standard Library
+import base64
 import typing as t
 import hashlib
 import secrets
 from datetime import datetime
 
 # Third Party
+import orjson
 from pydantic import Field, BaseModel, ConfigDict, field_validator
 
 # Project
@@ -89,8 +91,14 @@ class Query(BaseModel):
         return repr(self)
 
     def digest(self) -> str:
-        """Create SHA256 hash digest of model representation."""
-        return hashlib.sha256(repr(self).encode()).hexdigest()
+        """Create a compact BLAKE2b hash digest of the query's public fields.
+
+        Fields are serialized with sorted keys so that equivalent queries produce the same
+        digest. The 128-bit digest is encoded as unpadded URL-safe base64 (22 characters).
+        """
+        canonical = orjson.dumps(self.dict(), option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.blake2b(canonical, digest_size=16).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
 
     def random(self) -> str:
         """Create a random string to prevent client or proxy caching."""
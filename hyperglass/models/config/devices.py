@@ -7,7 +7,7 @@ from pathlib import Path
 from ipaddress import IPv4Address, IPv6Address
 
 # Third Party
-from pydantic import FilePath, ValidationInfo, field_validator
+from pydantic import FilePath, PrivateAttr, ValidationInfo, field_validator
 from netmiko.ssh_dispatcher import CLASS_MAPPER  # type: ignore
 
 # Project
@@ -69,6 +69,7 @@ class Device(HyperglassModelWithId, extra="allow"):
     driver: t.Optional[SupportedDriver] = None
     driver_config: t.Dict[str, t.Any] = {}
     attrs: t.Dict[str, str] = {}
+    _directive_ids: t.FrozenSet[str] = PrivateAttr(frozenset())
 
     def __init__(self, **kw) -> None:
         """Check legacy fields and ensure an `id` is set."""
@@ -77,6 +78,15 @@ class Device(HyperglassModelWithId, extra="allow"):
             kw = self._with_id(kw)
         super().__init__(**kw)
         self._validate_directive_attrs()
+        # Directive membership is checked on every query (by validation & plugins), so build the
+        # lookup set once, at config load.
+        self._directive_ids = frozenset(self.directive_ids)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        """Rebuild the directive lookup set when directives are reassigned."""
+        super().__setattr__(name, value)
+        if name == "directives":
+            self._directive_ids = frozenset(self.directive_ids)
 
     @property
     def _target(self):
@@ -130,10 +140,7 @@ class Device(HyperglassModelWithId, extra="allow"):
 
     def has_directives(self, *directive_ids: str) -> bool:
         """Determine if a directive is used on this device."""
-        for directive_id in directive_ids:
-            if directive_id in self.directive_ids:
-                return True
-        return False
+        return not self._directive_ids.isdisjoint(directive_ids)
 
     def get_device_type(self) -> str:
         """Get the `device_type` field for use by Netmiko.
@@ -4,9 +4,10 @@
 
 # Standard Library
 import re
-import json
 import typing as t
 from pathlib import Path
+from functools import lru_cache, singledispatch
+from collections.abc import Generator
 
 # Third Party
 from pydantic import HttpUrl, BaseModel, RootModel, ConfigDict, PrivateAttr
@@ -16,11 +17,19 @@ from hyperglass.log import log
 from hyperglass.util import compare_init, snake_to_camel, repr_from_attrs
 from hyperglass.types import Series
 
+if t.TYPE_CHECKING:
+    # Project
+    from hyperglass.models.system import HyperglassSettings
+
 MultiModelT = t.TypeVar("MultiModelT", bound=BaseModel)
 
 PathTypeT = t.TypeVar("PathTypeT")
 
+_ALIAS_SEPARATORS = re.compile(r"[\-|\.|\@|\~|\:\/|\s]")
+_ALIAS_VALID_CHARS = re.compile(r"([a-zA-Z]\w+|\_+)")
+
 
+@lru_cache(maxsize=None)
 def alias_generator(field: str) -> str:
     """Remove unsupported characters from field names.
 
@@ -28,12 +37,58 @@ def alias_generator(field: str) -> str:
     characters that are unsupported in Python class variable names.
     Also removes leading numbers underscores.
     """
-    _replaced = re.sub(r"[\-|\.|\@|\~|\:\/|\s]", "_", field)
-    _scrubbed = "".join(re.findall(r"([a-zA-Z]\w+|\_+)", _replaced))
+    _replaced = _ALIAS_SEPARATORS.sub("_", field)
+    _scrubbed = "".join(_ALIAS_VALID_CHARS.findall(_replaced))
     snake_field = _scrubbed.lower()
     return snake_to_camel(snake_field)
 
 
+def _strip_original_app_path(path: Path, settings: "HyperglassSettings") -> Path:
+    """Re-root a path under the default app_path, without the original app_path's parts."""
+    original_parts = settings.original_app_path.absolute().parts
+    return settings.default_app_path.joinpath(*(p for p in path.parts if p not in original_parts))
+
+
+@singledispatch
+def _convert_paths(value: t.Any, settings: "HyperglassSettings") -> t.Any:
+    """Convert paths contained in `value` to be relative to the default app_path."""
+    return value
+
+
+@_convert_paths.register(Path)
+def _(value: Path, settings: "HyperglassSettings") -> Path:
+    if settings.container:
+        return _strip_original_app_path(value, settings)
+    return value
+
+
+@_convert_paths.register(str)
+def _(value: str, settings: "HyperglassSettings") -> str:
+    if settings.container and str(settings.original_app_path.absolute()) in value:
+        return str(_strip_original_app_path(Path(value), settings))
+    return value
+
+
+@_convert_paths.register(tuple)
+def _(value: tuple, settings: "HyperglassSettings") -> tuple:
+    return tuple(_convert_paths(v, settings) for v in value)
+
+
+@_convert_paths.register(list)
+def _(value: list, settings: "HyperglassSettings") -> list:
+    return [_convert_paths(v, settings) for v in value]
+
+
+@_convert_paths.register(Generator)
+def _(value: Generator, settings: "HyperglassSettings") -> Generator:
+    return (_convert_paths(v, settings) for v in value)
+
+
+@_convert_paths.register(dict)
+def _(value: dict, settings: "HyperglassSettings") -> dict:
+    return {k: _convert_paths(v, settings) for k, v in value.items()}
+
+
 class HyperglassModel(BaseModel):
     """Base model for all hyperglass configuration models."""
 
@@ -56,38 +111,7 @@ class HyperglassModel(BaseModel):
         # Project
         from hyperglass.settings import Settings
 
-        if isinstance(value, Path):
-            if Settings.container:
-                return Settings.default_app_path.joinpath(
-                    *(
-                        p
-                        for p in value.parts
-                        if p not in Settings.original_app_path.absolute().parts
-                    )
-                )
-
-        if isinstance(value, str) and str(Settings.original_app_path.absolute()) in value:
-            if Settings.container:
-                path = Path(value)
-                return str(
-                    Settings.default_app_path.joinpath(
-                        *(
-                            p
-                            for p in path.parts
-                            if p not in Settings.original_app_path.absolute().parts
-                        )
-                    )
-                )
-
-        if isinstance(value, t.Tuple):
-            return tuple(self.convert_paths(v) for v in value)
-        if isinstance(value, t.List):
-            return [self.convert_paths(v) for v in value]
-        if isinstance(value, t.Generator):
-            return (self.convert_paths(v) for v in value)
-        if isinstance(value, t.Dict):
-            return {k: self.convert_paths(v) for k, v in value.items()}
-        return value
+        return _convert_paths(value, Settings)
 
     def _repr_from_attrs(self, attrs: Series[str]) -> str:
         """Alias to `hyperglass.util:repr_from_attrs` in the context of this model."""
@@ -116,9 +140,6 @@ class HyperglassModel(BaseModel):
     def export_yaml(self, *args, **kwargs):
         """Return instance as YAML."""
 
-        # Standard Library
-        import json
-
         # Third Party
         import yaml
 
@@ -127,13 +148,15 @@ class HyperglassModel(BaseModel):
             "exclude_unset": kwargs.pop("exclude_unset", False),
         }
 
-        return yaml.safe_dump(json.loads(self.export_json(**export_kwargs)), *args, **kwargs)
+        # JSON mode serializes non-primitive types (e.g. HttpUrl, Path) without a string round-trip.
+        return yaml.safe_dump(self.model_dump(mode="json", **export_kwargs), *args, **kwargs)
 
 
 class HyperglassUniqueModel(HyperglassModel):
     """hyperglass model that is unique by its `id` field."""
 
     _unique_fields: t.ClassVar[Series[str]] = ()
+    _hash: t.Optional[int] = PrivateAttr(None)
 
     def __init_subclass__(cls, *, unique_by: Series[str], **kw: t.Any) -> None:
         """Assign unique fields to class."""
@@ -153,9 +176,38 @@ class HyperglassUniqueModel(HyperglassModel):
         return not self.__eq__(other)
 
     def __hash__(self: "HyperglassUniqueModel") -> int:
-        """Create a hashed representation of this model's name."""
-        fields = dict(zip(self._unique_fields, (getattr(self, f) for f in self._unique_fields)))
-        return hash(json.dumps(fields))
+        """Create a hashed representation of this model's unique fields.
+
+        The hash is computed once and reset if a unique field is reassigned.
+        """
+        if self._hash is None:
+            values = (getattr(self, f) for f in self._unique_fields)
+            self._hash = hash(tuple(tuple(v) if isinstance(v, list) else v for v in values))
+        return self._hash
+
+    def __setattr__(self: "HyperglassUniqueModel", name: str, value: t.Any) -> None:
+        """Invalidate the cached hash when a unique field changes."""
+        if name in self._unique_fields:
+            self._hash = None
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self: "HyperglassUniqueModel",
+        *,
+        update: t.Optional[t.Mapping[str, t.Any]] = None,
+        deep: bool = False,
+    ) -> "HyperglassUniqueModel":
+        """Copy the model, resetting the cached hash since `update` bypasses `__setattr__`."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._hash = None
+        return copied
+
+    def __getstate__(self: "HyperglassUniqueModel") -> t.Dict[str, t.Any]:
+        """Exclude the cached hash when pickling, since string hashes differ between processes."""
+        state = super().__getstate__()
+        if state.get("__pydantic_private__") is not None:
+            state["__pydantic_private__"] = {**state["__pydantic_private__"], "_hash": None}
+        return state
 
 
 class HyperglassModelWithId(HyperglassModel):
@@ -165,11 +217,7 @@ class HyperglassModelWithId(HyperglassModel):
 
     def __eq__(self: "HyperglassModelWithId", other: "HyperglassModelWithId") -> bool:
         """Other model is equal to this model."""
-        if not isinstance(other, self.__class__):
-            return False
-        if hasattr(other, "id"):
-            return other and self.id == other.id
-        return False
+        return type(other) is type(self) and other.id == self.id
 
     def __ne__(self: "HyperglassModelWithId", other: "HyperglassModelWithId") -> bool:
         """Other model is not equal to this model."""
@@ -194,6 +242,8 @@ class MultiModel(RootModel[MultiModelT]):
 
     root: t.List[MultiModelT] = []
     _count: int = PrivateAttr()
+    _by_key: t.Dict[t.Any, MultiModelT] = PrivateAttr(default_factory=dict)
+    _ids: t.Optional[t.Tuple[t.Any, ...]] = PrivateAttr(None)
 
     def __init__(self, *items: t.Union[MultiModelT, t.Dict[str, t.Any]]) -> None:
         """Validate items."""
@@ -203,6 +253,7 @@ class MultiModel(RootModel[MultiModelT]):
         valid = self._valid_items(*items)
         super().__init__(root=valid)
         self._count = len(self.root)
+        self._index()
 
     def __init_subclass__(cls, **kw: t.Any) -> None:
         """Add class variables from keyword arguments."""
@@ -231,14 +282,14 @@ class MultiModel(RootModel[MultiModelT]):
         if isinstance(value, int):
             return self.root[value]
 
-        for item in self:
-            if hasattr(item, self.unique_by) and getattr(item, self.unique_by) == value:
-                return item
-        raise IndexError(
-            "No match found for {!s}.{!s}={!r}".format(
-                self.model.__class__.__name__, self.unique_by, value
-            ),
-        )
+        try:
+            return self._by_key[value]
+        except KeyError as err:
+            raise IndexError(
+                "No match found for {!s}.{!s}={!r}".format(
+                    self.model.__class__.__name__, self.unique_by, value
+                ),
+            ) from err
 
     def __add__(self, other: MultiModelT) -> MultiModelT:
         """Merge another MultiModel with this one.
@@ -271,7 +322,9 @@ class MultiModel(RootModel[MultiModelT]):
     @property
     def ids(self) -> t.Tuple[t.Any, ...]:
         """Get values of all items by `unique_by` property."""
-        return tuple(sorted(getattr(item, self.unique_by) for item in self))
+        if self._ids is None:
+            self._ids = tuple(sorted(getattr(item, self.unique_by) for item in self))
+        return self._ids
 
     @property
     def count(self) -> int:
@@ -281,42 +334,42 @@ class MultiModel(RootModel[MultiModelT]):
     @classmethod
     def create(cls, name: str, *, model: MultiModelT, unique_by: str) -> "MultiModel":
         """Create a MultiModel."""
-        new = type(name, (cls,), cls.__dict__)
-        new.model = model
-        new.unique_by = unique_by
-        new._model_name = getattr(model, "__name__", "MultiModel")
-        return new
+        # Class variables are assigned by `__init_subclass__` from the keyword arguments.
+        return type(name, (cls,), {"__module__": cls.__module__}, model=model, unique_by=unique_by)
 
     def _valid_items(
         self, *to_validate: t.List[t.Union[MultiModelT, t.Dict[str, t.Any]]]
     ) -> t.List[MultiModelT]:
-        items = [
-            item
-            for item in to_validate
-            if any(
-                (
-                    (isinstance(item, self.model) and hasattr(item, self.unique_by)),
-                    (isinstance(item, t.Dict) and self.unique_by in item),
-                ),
-            )
-        ]
-        for index, item in enumerate(items):
-            if isinstance(item, t.Dict):
-                items[index] = self.model(**item)
+        model = self.model
+        unique_by = self.unique_by
+        items = []
+        for item in to_validate:
+            if isinstance(item, model) and hasattr(item, unique_by):
+                items.append(item)
+            elif isinstance(item, dict) and unique_by in item:
+                items.append(model(**item))
         return items
 
+    def _index(self) -> None:
+        """Map each item's `unique_by` value to the first item with that value.
+
+        Also resets cached values derived from the items, such as `ids`.
+        """
+        self._ids = None
+        self._by_key = {}
+        for item in self.root:
+            if hasattr(item, self.unique_by):
+                self._by_key.setdefault(getattr(item, self.unique_by), item)
+
     def _merge_with(self, *items, unique_by: t.Optional[str] = None) -> Series[MultiModelT]:
         to_add = self._valid_items(*items)
         if unique_by is not None:
-            unique_by_values = {
-                getattr(obj, unique_by) for obj in (*self, *to_add) if hasattr(obj, unique_by)
-            }
-            unique_by_objects = {
-                v: o
-                for v in unique_by_values
-                for o in (*self, *to_add)
-                if getattr(o, unique_by) == v
-            }
+            # Later items replace earlier items with the same `unique_by` value, but keep the
+            # position of the first occurrence.
+            unique_by_objects = {}
+            for obj in (*self.root, *to_add):
+                if hasattr(obj, unique_by):
+                    unique_by_objects[getattr(obj, unique_by)] = obj
             return tuple(unique_by_objects.values())
         return (*self.root, *to_add)
 
@@ -336,9 +389,9 @@ class MultiModel(RootModel[MultiModelT]):
             `Model` is yielded.
             """
             for search in searches:
-                pattern = re.compile(rf".*{search}.*", re.IGNORECASE)
+                pattern = re.compile(re.escape(search), re.IGNORECASE)
                 for item in self:
-                    if pattern.match(getattr(item, self.unique_by)):
+                    if pattern.search(getattr(item, self.unique_by)):
                         yield item
 
         return self.__class__(*matches(*unique))
@@ -348,6 +401,7 @@ class MultiModel(RootModel[MultiModelT]):
         new = self._merge_with(*items, unique_by=unique_by)
         self.root = new
         self._count = len(self.root)
+        self._index()
         for item in new:
             log.debug(
                 "Added {} '{!s}' to {}".format(
@@ -0,0 +1,60 @@
+"""Test device models."""
+
+# Standard Library
+import typing as t
+
+# Third Party
+import pytest
+
+# Project
+from hyperglass.state import use_state
+from hyperglass.state.hooks import _use_state
+from hyperglass.models.directive import Directives
+from hyperglass.models.config.params import Params
+
+# Local
+from ..config.devices import Device
+
+if t.TYPE_CHECKING:
+    # Project
+    from hyperglass.state import HyperglassState
+
+DEVICE = {
+    "name": "test1",
+    "address": "127.0.0.1",
+    "credential": {"username": "", "password": ""},
+    "platform": "juniper",
+    "directives": ["test_directive1"],
+}
+
+
+@pytest.fixture
+def state() -> t.Generator["HyperglassState", None, None]:
+    """Test fixture to initialize Redis store."""
+    # Device validation reads directives through use_state(), which caches them across tests.
+    _use_state.cache_clear()
+    _state = use_state()
+    directives = Directives.new(
+        {"test_directive1": {"name": "Test Directive 1", "field": {"description": "test"}}},
+        {"test_directive2": {"name": "Test Directive 2", "field": {"description": "test"}}},
+    )
+    with _state.cache.pipeline() as pipeline:
+        pipeline.set("params", Params())
+        pipeline.set("directives", directives)
+
+    yield _state
+    _state.clear()
+    _use_state.cache_clear()
+
+
+def test_device_has_directives(state):
+    device = Device(**DEVICE)
+    assert device.has_directives("test_directive1")
+    assert device.has_directives("other", "test_directive1")
+    assert not device.has_directives("test_directive2")
+    assert not device.has_directives()
+
+    device.directives = ["test_directive2", {"builtins": False}]
+    assert device.directive_ids == ["test_directive2"]
+    assert device.has_directives("test_directive2")
+    assert not device.has_directives("test_directive1")
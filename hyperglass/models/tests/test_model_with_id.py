@@ -0,0 +1,38 @@
+"""Test models identified by their `id` field."""
+
+# Standard Library
+from types import SimpleNamespace
+
+# Local
+from ..main import HyperglassModelWithId
+
+
+class Item(HyperglassModelWithId):
+    """Test item."""
+
+    name: str = ""
+
+
+class SubItem(Item):
+    """Test item subclass."""
+
+
+def test_model_with_id_equality():
+    item = Item(id="item1", name="Item One")
+    same = Item(id="item1", name="Another Name")
+    other = Item(id="item2", name="Item One")
+
+    assert item == same
+    assert not item != same
+    assert item != other
+    assert item != SubItem(id="item1", name="Item One")
+    assert item != SimpleNamespace(id="item1")
+    assert item != "item1"
+
+
+def test_model_with_id_hash():
+    item = Item(id="item1", name="Item One")
+    same = Item(id="item1", name="Another Name")
+
+    assert hash(item) == hash(same)
+    assert len({item, same, Item(id="item2")}) == 2
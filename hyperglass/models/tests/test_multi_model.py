@@ -1,6 +1,7 @@
 """Test HyperglassMultiModel."""
 
 # Third Party
+import pytest
 from pydantic import BaseModel
 
 # Local
@@ -46,3 +47,43 @@ def test_multi_model():
     model.add(*ITEMS_3, unique_by="id")
     assert model.count == 6
     assert model["item1"].name == "Item New One"
+
+
+def test_multi_model_merge_order():
+    model = Items(*ITEMS_1)
+    model.add(*ITEMS_3, unique_by="id")
+    assert model.ids == ("item1", "item2", "item3", "item6")
+    assert [item.id for item in model] == ["item1", "item2", "item3", "item6"]
+    assert model[0].name == "Item New One"
+
+
+def test_multi_model_getitem():
+    model = Items(*ITEMS_1)
+    assert model["item2"].name == "Item Two"
+    model.add(*ITEMS_2)
+    assert model["item5"].name == "Item Five"
+    with pytest.raises(IndexError):
+        model["item7"]
+
+
+def test_multi_model_matching():
+    model = Items(*ITEMS_1, *ITEMS_2)
+    assert model.matching("ITEM1").ids == ("item1",)
+    assert model.matching("tem").count == 5
+    assert model.matching("item.").count == 0
+
+
+def test_multi_model_ids():
+    model = Items(*ITEMS_1)
+    assert model.ids == ("item1", "item2", "item3")
+    model.add(*ITEMS_2)
+    assert model.ids == ("item1", "item2", "item3", "item4", "item5")
+
+
+def test_multi_model_create():
+    Created = MultiModel.create("Created", model=Item, unique_by="id")  # noqa: N806
+    model = Created(*ITEMS_1)
+    assert Created.model is Item
+    assert Created.unique_by == "id"
+    assert model.count == 3
+    assert model["item3"].name == "Item Three"
@@ -0,0 +1,26 @@
+"""Test query model utilities."""
+
+# Standard Library
+import re
+
+# Local
+from ..api.query import Query
+
+
+def _query(**data) -> Query:
+    # Skip Query.__init__, which validates against the device & directive config in state.
+    return Query.model_construct(**data)
+
+
+def test_query_digest():
+    query1 = _query(query_location="loc1", query_target=["192.0.2.0/24"], query_type="bgp_route")
+    query2 = _query(
+        query_type="bgp_route", query_target=["192.0.2.0/24"], query_location="loc1", extra="x"
+    )
+    query3 = _query(query_location="loc1", query_target=["192.0.2.0/25"], query_type="bgp_route")
+
+    digest = query1.digest()
+    assert digest == query2.digest(), "equivalent queries have different digests"
+    assert digest != query3.digest(), "different queries have the same digest"
+    assert re.fullmatch(r"[A-Za-z0-9_-]{22}", digest) is not None, "digest is not URL-safe"
+    assert "." not in digest
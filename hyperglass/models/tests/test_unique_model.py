@@ -0,0 +1,48 @@
+"""Test unique model hashing."""
+
+# Standard Library
+import pickle
+
+# Local
+from ..directive import Directive, BuiltinDirective
+
+FIELD = {"description": "Test Field"}
+
+
+def test_unique_model_hash():
+    directive = Directive(id="test", name="Test", field=FIELD)
+    original = hash(directive)
+    assert hash(directive) == original
+    assert directive == Directive(id="test", name="Other Name", field=FIELD)
+
+    directive.id = "changed"
+    assert hash(directive) != original
+    assert hash(directive) == hash(Directive(id="changed", name="Test", field=FIELD))
+
+
+def test_unique_model_copy():
+    directive = Directive(id="test", name="Test", field=FIELD)
+    original = hash(directive)
+    copied = directive.model_copy(update={"id": "changed"})
+    assert hash(copied) != original
+    assert hash(copied) == hash(Directive(id="changed", name="Test", field=FIELD))
+    assert hash(directive) == original
+
+
+def test_unique_model_pickle():
+    directive = Directive(id="test", name="Test", field=FIELD)
+    hash(directive)
+    assert directive._hash is not None
+
+    loaded = pickle.loads(pickle.dumps(directive))  # noqa
+    assert loaded._hash is None
+    assert loaded == directive
+    assert directive._hash is not None
+
+
+def test_unique_model_list_field():
+    directive = BuiltinDirective(id="test", name="Test", field=FIELD, platforms=["juniper"])
+    other = BuiltinDirective(id="test", name="Test", field=FIELD, platforms=["arista_eos"])
+    assert isinstance(hash(directive), int)
+    assert directive != other
+    assert len({directive, other}) == 2
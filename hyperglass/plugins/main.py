@@ -4,7 +4,7 @@
 import sys
 import shutil
 import typing as t
-from inspect import isclass, getmembers
+from inspect import isclass
 from pathlib import Path
 from importlib.util import module_from_spec, spec_from_file_location
 
@@ -29,7 +29,9 @@ def _is_class(module: t.Any, obj: object) -> bool:
 def _register_from_module(module: t.Any, **kwargs: t.Any) -> t.Tuple[str, ...]:
     """Register defined classes from the module."""
     failures = ()
-    defs = getmembers(module, lambda o: _is_class(module, o))
+    # Read the module namespace directly rather than via `inspect.getmembers`, which resolves
+    # and sorts every attribute of the module.
+    defs = [(name, obj) for name, obj in vars(module).items() if _is_class(module, obj)]
     sys.modules[module.__name__] = module
     for name, plugin in defs:
         if issubclass(plugin, OutputPlugin):
@@ -5,12 +5,14 @@ import typing as t
 
 # Third Party
 from redis import Redis, ConnectionPool
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
 
 # Project
 from hyperglass.util import repr_from_attrs
 
 # Local
-from .redis import RedisManager
+from .redis import RedisManager, AsyncRedisManager
 
 if t.TYPE_CHECKING:
     # Project
@@ -25,6 +27,7 @@ class StateManager:
 
     settings: "HyperglassSettings"
     redis: RedisManager
+    async_redis: AsyncRedisManager
     _namespace: str = "hyperglass.state"
 
     def __init__(self, *, settings: "HyperglassSettings") -> None:
@@ -34,6 +37,11 @@ class StateManager:
         connection_pool = ConnectionPool.from_url(**self.settings.redis_connection_pool)
         redis = Redis(connection_pool=connection_pool)
         self.redis = RedisManager(instance=redis, namespace=self._namespace)
+        # Connections are established lazily, so a single pool can be shared by all requests
+        # handled by this process' event loop.
+        async_connection_pool = AsyncConnectionPool.from_url(**self.settings.redis_connection_pool)
+        async_redis = AsyncRedis(connection_pool=async_connection_pool)
+        self.async_redis = AsyncRedisManager(instance=async_redis, namespace=self._namespace)
 
     def __repr__(self) -> str:
         """Represent state manager by name and namespace."""
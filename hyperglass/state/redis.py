@@ -6,6 +6,7 @@ import typing as t
 from types import TracebackType
 from typing import overload
 from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
 
 # Project
 from hyperglass.log import log
@@ -15,15 +16,17 @@ if t.TYPE_CHECKING:
     # Third Party
     from redis import Redis
     from redis.client import Pipeline
+    from redis.asyncio import Redis as AsyncRedis
+    from redis.asyncio.client import Pipeline as AsyncPipeline
 
 
-class RedisManager:
-    """Convenience wrapper for managing a redis session."""
+class BaseRedisManager:
+    """Common key handling for sync & async redis session wrappers."""
 
-    instance: "Redis"
+    instance: t.Union["Redis", "AsyncRedis"]
     namespace: str
 
-    def __init__(self, instance: "Redis", namespace: str) -> None:
+    def __init__(self, instance: t.Union["Redis", "AsyncRedis"], namespace: str) -> None:
         """Set up Redis connection and add configuration objects."""
         self.instance = instance
         self.namespace = namespace
@@ -48,6 +51,12 @@ class RedisManager:
             return self._key_join(*key)
         return self._key_join(key)
 
+
+class RedisManager(BaseRedisManager):
+    """Convenience wrapper for managing a redis session."""
+
+    instance: "Redis"
+
     def check(self) -> bool:
         """Ensure the redis instance is running and reachable."""
         result = self.instance.ping()
@@ -185,3 +194,55 @@ class RedisManager:
             instance=self.instance.pipeline(),
             namespace=self.namespace,
         )
+
+
+class AsyncRedisManager(BaseRedisManager):
+    """Convenience wrapper for managing an asyncio redis session.
+
+    Used from request handlers so that cache access doesn't block the event loop.
+    """
+
+    instance: "AsyncRedis"
+
+    async def get_map_items(
+        self,
+        key: str,
+        *items: str,
+        expire_in: t.Optional[t.Union[timedelta, int]] = None,
+    ) -> t.Tuple[t.Any, ...]:
+        """Get multiple values from a Redis hash map (dict) in a single round trip.
+
+        If `expire_in` is specified, the key's expiration is reset in the same transaction.
+        """
+        name = self.key(key)
+        async with self.instance.pipeline(transaction=True) as pipeline:
+            pipeline.hmget(name, *items)
+            if isinstance(expire_in, (timedelta, int)):
+                pipeline.expire(name, expire_in)
+            values, *_ = await pipeline.execute()
+        return tuple(pickle.loads(v) if isinstance(v, bytes) else None for v in values)  # noqa
+
+    @asynccontextmanager
+    async def batch(self) -> t.AsyncGenerator["AsyncRedisBatch", None]:
+        """Queue commands and send them to Redis in a single round trip on exit.
+
+        Commands are sent as a non-transactional pipeline, and are discarded if an exception is
+        raised within the context.
+        """
+        async with self.instance.pipeline(transaction=False) as pipeline:
+            yield AsyncRedisBatch(instance=pipeline, namespace=self.namespace)
+            await pipeline.execute()
+
+
+class AsyncRedisBatch(BaseRedisManager):
+    """Queue commands on an asyncio redis pipeline, with the same key & value handling."""
+
+    instance: "AsyncPipeline"
+
+    def expire(self, key: str, expire_in: t.Union[timedelta, int]) -> None:
+        """Expire a cache key in a number of seconds."""
+        self.instance.expire(self.key(key), expire_in)
+
+    def set_map(self, key: str, mapping: t.Dict[str, t.Any]) -> None:
+        """Add multiple values to a hash map (dict)."""
+        self.instance.hset(self.key(key), mapping={k: pickle.dumps(v) for k, v in mapping.items()})
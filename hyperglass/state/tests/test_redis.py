@@ -0,0 +1,81 @@
+"""Test Redis managers."""
+
+# Standard Library
+import typing as t
+import asyncio
+
+# Third Party
+import pytest
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio import ConnectionPool as AsyncConnectionPool
+
+# Project
+from hyperglass.settings import Settings
+
+# Local
+from ..redis import AsyncRedisManager
+
+KEY = "q:test"
+ITEMS = {"output": {"data": [1, 2]}, "timestamp": "2024-01-01 01:02:03"}
+
+
+def _run_async(test: t.Callable[[AsyncRedisManager], t.Awaitable[None]]) -> None:
+    async def run():
+        # Connections are bound to an event loop, so create a client for each loop.
+        connection_pool = AsyncConnectionPool.from_url(**Settings.redis_connection_pool)
+        cache = AsyncRedisManager(
+            instance=AsyncRedis(connection_pool=connection_pool), namespace="hyperglass.test"
+        )
+        try:
+            await test(cache)
+        finally:
+            await cache.instance.delete(cache.key(KEY))
+            await connection_pool.disconnect()
+
+    asyncio.run(run())
+
+
+def test_async_get_map_items_miss():
+    async def test(cache: AsyncRedisManager):
+        assert await cache.get_map_items(KEY, "output", "timestamp") == (None, None)
+
+    _run_async(test)
+
+
+def test_async_batch():
+    async def test(cache: AsyncRedisManager):
+        async with cache.batch() as batch:
+            batch.set_map(KEY, ITEMS)
+            batch.expire(KEY, 10)
+
+        assert 0 < await cache.instance.ttl(cache.key(KEY)) <= 10
+        assert await cache.get_map_items(KEY, "output", "timestamp") == tuple(ITEMS.values())
+
+    _run_async(test)
+
+
+def test_async_get_map_items_expire():
+    async def test(cache: AsyncRedisManager):
+        async with cache.batch() as batch:
+            batch.set_map(KEY, ITEMS)
+            batch.expire(KEY, 10)
+
+        values = await cache.get_map_items(KEY, "output", "timestamp", expire_in=60)
+        assert values == tuple(ITEMS.values())
+        assert 10 < await cache.instance.ttl(cache.key(KEY)) <= 60
+
+    _run_async(test)
+
+
+def test_async_batch_error():
+    async def test(cache: AsyncRedisManager):
+        with pytest.raises(RuntimeError):
+            async with cache.batch() as batch:
+                batch.set_map(KEY, ITEMS)
+                batch.expire(KEY, 10)
+                raise RuntimeError("Test")
+
+        assert await cache.instance.exists(cache.key(KEY)) == 0
+        assert await cache.get_map_items(KEY, "output", "timestamp") == (None, None)
+
+    _run_async(test)